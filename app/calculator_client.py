@@ -0,0 +1,387 @@
+"""
+Client library for the calculator service.
+
+Reuses http.client connections from a small pool, retries transient
+failures with exponential backoff, tracks client-side latency and can
+coalesce calls made within a short window into one /calculate/batch request.
+Connections are only reused when the server keeps them alive; the Werkzeug
+development server closes every connection after its response.
+"""
+import asyncio
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import deque
+
+RETRY_STATUSES = (502, 503, 504)
+
+
+class _PendingBatch:
+    """Calls waiting to be sent together in one batch request"""
+
+    def __init__(self):
+        self.payloads = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.responses = None
+        self.error = None
+
+
+class CalculatorClient:
+    """
+    Thread-safe synchronous client.
+
+    With batch_window > 0, calls arriving from different threads within
+    batch_window seconds of each other share one request. A lone call still
+    waits out the window, so leave batching off for single-threaded callers.
+    """
+
+    def __init__(self, host='localhost', port=5000, pool_size=4, timeout=10.0,
+                 retries=2, backoff=0.05, batch_window=0, max_batch=32):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+
+        self._pool = queue.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put(None)
+        self._latencies = deque(maxlen=1000)
+        self._stats_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        self.requests_sent = 0
+        self._batch_lock = threading.Lock()
+        self._pending = None
+
+    def calculate(self, operation, numbers):
+        """Apply operation to numbers, e.g. calculate("add", [1, 2])"""
+        return self._call({"operation": operation, "numbers": numbers})
+
+    def evaluate(self, equation):
+        """Evaluate an equation string, e.g. evaluate("10*4+3-2")"""
+        return self._call({"equation": equation})
+
+    def calculate_many(self, payloads):
+        """
+        Send several /calculate payloads in one request.
+        Returns one {"result": ...} or {"error": ...} dict per payload.
+        """
+        start = time.perf_counter()
+        try:
+            return self._post_batch(list(payloads))
+        finally:
+            self._record(time.perf_counter() - start)
+
+    def _post_batch(self, payloads):
+        status, data = self._post('/calculate/batch', payloads)
+        if status != 200:
+            raise ValueError(data.get('error', f"Unexpected status {status}"))
+        return data['results']
+
+    def latency_stats(self):
+        """
+        Client-side call latency summary in milliseconds, measured from call
+        start to result, including pool waits, retries and batching delay.
+        """
+        with self._stats_lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return {'count': 0}
+
+        def percentile(p):
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000
+
+        return {
+            'count': len(samples),
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'p99_ms': percentile(0.99),
+            'max_ms': samples[-1] * 1000,
+        }
+
+    def close(self):
+        """
+        Close all idle pooled connections. Connections in use are closed as
+        they are returned, and later calls raise RuntimeError.
+        """
+        with self._pool_lock:
+            self._closed = True
+            slots = 0
+            while True:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not None:
+                    conn.close()
+                slots += 1
+            # Keep the slot count so threads blocked on the pool wake up
+            for _ in range(slots):
+                self._pool.put(None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _call(self, payload):
+        start = time.perf_counter()
+        try:
+            response = self._request(payload)
+        finally:
+            self._record(time.perf_counter() - start)
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response['result']
+
+    def _request(self, payload):
+        """Send one /calculate payload, batched if enabled, and return its response"""
+        if self.batch_window > 0:
+            return self._call_batched(payload)
+        return self._post('/calculate', payload)[1]
+
+    def _record(self, seconds):
+        with self._stats_lock:
+            self._latencies.append(seconds)
+
+    def _call_batched(self, payload):
+        """
+        Queue payload on the pending batch. The first caller becomes the
+        leader: it waits for the window to pass or the batch to fill, then
+        sends it and hands each caller its response.
+        """
+        with self._batch_lock:
+            batch = self._pending
+            leader = batch is None
+            if leader:
+                batch = self._pending = _PendingBatch()
+            index = len(batch.payloads)
+            batch.payloads.append(payload)
+            if len(batch.payloads) >= self.max_batch:
+                self._pending = None
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.batch_window)
+            with self._batch_lock:
+                if self._pending is batch:
+                    self._pending = None
+            try:
+                if len(batch.payloads) == 1:
+                    batch.responses = [self._post('/calculate', batch.payloads[0])[1]]
+                else:
+                    batch.responses = self._post_batch(batch.payloads)
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            if leader:
+                raise batch.error
+            raise _batch_error(batch.error) from batch.error
+        if batch.responses is None:
+            raise RuntimeError("Batch request was interrupted")
+        return batch.responses[index]
+
+    def _checkout(self):
+        if self._closed:
+            raise RuntimeError("Client is closed")
+        try:
+            conn = self._pool.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError("No pooled connection became free") from None
+        if self._closed:
+            self._pool.put(conn)
+            raise RuntimeError("Client is closed")
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return conn
+
+    def _checkin(self, conn):
+        with self._pool_lock:
+            if self._closed:
+                conn.close()
+            self._pool.put(conn)
+
+    def _post(self, path, payload):
+        """POST JSON with retries, returning (status, decoded body)"""
+        body = json.dumps(payload).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+
+        for attempt in range(self.retries + 1):
+            conn = self._checkout()
+            with self._stats_lock:
+                self.requests_sent += 1
+            try:
+                conn.request('POST', path, body=body, headers=headers)
+                response = conn.getresponse()
+                status = response.status
+                raw = response.read()
+            except (OSError, http.client.HTTPException):
+                # Drop the socket; http.client reconnects on next use
+                conn.close()
+                if attempt == self.retries:
+                    raise
+            else:
+                if status not in RETRY_STATUSES or attempt == self.retries:
+                    return status, _decode(status, raw)
+            finally:
+                self._checkin(conn)
+            time.sleep(self.backoff * (2 ** attempt))
+
+
+def _batch_error(error):
+    """
+    Copy a batch failure for another waiting caller, so each caller raises
+    its own exception and traceback. Chain it to the original with `from`.
+    """
+    try:
+        copy = type(error)(*error.args)
+    except Exception:
+        copy = RuntimeError(f"Batch request failed: {error}")
+    copy.__cause__ = error
+    return copy
+
+
+def _decode(status, raw):
+    """Decode a JSON response body, naming the status if it is not JSON"""
+    try:
+        return json.loads(raw.decode('utf-8'))
+    except ValueError:
+        raise RuntimeError(f"Unexpected non-JSON response with status {status}") from None
+
+
+class AsyncCalculatorClient:
+    """
+    asyncio client backed by the pooled CalculatorClient transport.
+
+    Blocking requests run in worker threads, so up to pool_size of them are
+    in flight at once. With batch_window > 0, calls awaited within the window
+    are coalesced into one /calculate/batch request.
+    """
+
+    def __init__(self, host='localhost', port=5000, pool_size=4, timeout=10.0,
+                 retries=2, backoff=0.05, batch_window=0, max_batch=32):
+        self._client = CalculatorClient(host, port, pool_size, timeout, retries, backoff)
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._pending = []
+        self._flush_tasks = set()
+        self._timer = None
+
+    async def calculate(self, operation, numbers):
+        """Apply operation to numbers, e.g. await calculate("add", [1, 2])"""
+        return await self._call({"operation": operation, "numbers": numbers})
+
+    async def evaluate(self, equation):
+        """Evaluate an equation string, e.g. await evaluate("10*4+3-2")"""
+        return await self._call({"equation": equation})
+
+    async def calculate_many(self, payloads):
+        """Send several /calculate payloads in one request"""
+        return await asyncio.to_thread(self._client.calculate_many, list(payloads))
+
+    def latency_stats(self):
+        """Client-side call latency summary in milliseconds"""
+        return self._client.latency_stats()
+
+    @property
+    def requests_sent(self):
+        """HTTP requests sent, including retries"""
+        return self._client.requests_sent
+
+    async def aclose(self):
+        """Flush pending calls and close pooled connections"""
+        while self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        self._client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _call(self, payload):
+        start = time.perf_counter()
+        try:
+            if self.batch_window <= 0:
+                response = await asyncio.to_thread(self._client._request, payload)
+            else:
+                response = await self._enqueue(payload)
+        finally:
+            self._client._record(time.perf_counter() - start)
+        if 'error' in response:
+            raise ValueError(response['error'])
+        return response['result']
+
+    def _enqueue(self, payload):
+        """
+        Add payload to the pending batch and return a future for its response.
+        The first payload starts the window timer; a full batch is sent at
+        once and the timer cancelled.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch:
+            if self._timer is not None:
+                self._timer, timer = None, self._timer
+                timer.cancel()
+            self._track(self._send(self._take()))
+        elif len(self._pending) == 1:
+            self._timer = self._track(self._flush_after(self.batch_window))
+        return future
+
+    def _take(self):
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _track(self, coro):
+        task = asyncio.create_task(coro)
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+        return task
+
+    async def _flush_after(self, delay):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Cancelled from outside rather than by an early flush
+            if self._timer is asyncio.current_task():
+                self._timer = None
+                for _, future in self._take():
+                    future.cancel()
+            raise
+        self._timer = None
+        await self._send(self._take())
+
+    async def _send(self, batch):
+        """Send batch and resolve every caller's future, whatever happens"""
+        try:
+            payloads = [payload for payload, _ in batch]
+            if len(payloads) == 1:
+                _, data = await asyncio.to_thread(self._client._post, '/calculate', payloads[0])
+                responses = [data]
+            else:
+                responses = await asyncio.to_thread(self._client._post_batch, payloads)
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+        except Exception as e:
+            for i, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_exception(e if i == 0 else _batch_error(e))
+        finally:
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
@@ -27,17 +27,45 @@ def calculator():
         if not data:
             return jsonify({"error": "No JSON data provided"}), 400
         
-        if "equation" in data:
-            result = evaluate_equation(data["equation"])
-        else:
-            result = calculate(data)
-            
-        return jsonify({"result": result})
+        return jsonify({"result": compute(data)})
     
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": "Internal server error"}), 500
 
+
+@app.route("/calculate/batch", methods=['POST'])
+def calculator_batch():
+    """
+    Batch endpoint that accepts a JSON list of /calculate payloads and
+    answers them in one round trip:
+       [{"equation": "2+2"}, {"operation": "add", "numbers": [1, 2]}]
+    Each item gets its own {"result": ...} or {"error": ...} entry, in order.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return jsonify({"error": "Expected a JSON list of calculations"}), 400
+
+    results = []
+    for item in data:
+        try:
+            if not isinstance(item, dict) or not item:
+                raise ValueError("No JSON data provided")
+            results.append({"result": compute(item)})
+        except ValueError as e:
+            results.append({"error": str(e)})
+        except Exception as e:
+            results.append({"error": "Internal server error"})
+
+    return jsonify({"results": results})
+
+
+def compute(data):
+    """Evaluate a single /calculate payload"""
+    if "equation" in data:
+        return evaluate_equation(data["equation"])
+    return calculate(data)
+
 if __name__ == "__main__":
     app.run()
@@ -3,8 +3,89 @@ Minimal test helper for Solver sessions that can be copied to any repository.
 No external dependencies, no relative imports needed.
 """
 import json
+import statistics
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
 
+
+def measure(func, repeat=1, warmup=0, max_ms=None, max_alloc_kb=None):
+    """
+    Run func and check it against optional performance budgets.
+
+    Timing uses time.perf_counter over `repeat` runs after `warmup` untimed
+    runs. When max_alloc_kb is set, one extra run is traced with tracemalloc
+    so the tracing overhead does not distort the timings.
+    Module-level so it can be shipped to a ProcessPoolExecutor.
+    """
+    timings = []
+    peak_alloc_kb = None
+    try:
+        for _ in range(warmup):
+            func()
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        if max_alloc_kb is not None:
+            already_tracing = tracemalloc.is_tracing()
+            if not already_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            try:
+                func()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                if not already_tracing:
+                    tracemalloc.stop()
+            peak_alloc_kb = (peak - baseline) / 1024
+
+        success = True
+        error = None
+    except AssertionError as e:
+        success = False
+        error = str(e)
+    except Exception as e:
+        success = False
+        error = f"{type(e).__name__}: {str(e)}"
+
+    return _result(success, error, timings, peak_alloc_kb, max_ms, max_alloc_kb)
+
+
+def _result(success, error, timings=(), peak_alloc_kb=None, max_ms=None, max_alloc_kb=None):
+    """Build a result record, failing it if a budget was exceeded"""
+    median_ms = statistics.median(timings) * 1000 if timings else None
+
+    if success and max_ms is not None and median_ms > max_ms:
+        success = False
+        error = f"Latency budget exceeded: median {median_ms:.3f}ms > {max_ms}ms"
+    if success and max_alloc_kb is not None and peak_alloc_kb > max_alloc_kb:
+        success = False
+        error = f"Allocation budget exceeded: peak {peak_alloc_kb:.1f}KB > {max_alloc_kb}KB"
+
+    return {
+        'success': success,
+        'error': error,
+        'duration': sum(timings),
+        'runs': len(timings),
+        'min_ms': min(timings) * 1000 if timings else None,
+        'median_ms': median_ms,
+        'max_ms': max(timings) * 1000 if timings else None,
+        'budget_ms': max_ms,
+        'peak_alloc_kb': peak_alloc_kb,
+        'budget_alloc_kb': max_alloc_kb,
+    }
+
+
+def _unrunnable(e, options):
+    """Result for a test that could not be run at all (e.g. unpicklable func)"""
+    return _result(False, f"{type(e).__name__}: {str(e)}",
+                   max_ms=options.get('max_ms'), max_alloc_kb=options.get('max_alloc_kb'))
+
+
 class MinimalTester:
     """
     Self-contained test helper for Solver sessions.
@@ -17,31 +98,64 @@ class MinimalTester:
         self.client = flask_app.test_client() if flask_app else None
         self.results = []
     
-    def test(self, name, func):
-        """Run and record a test"""
-        start_time = datetime.now()
-        try:
-            func()
-            success = True
-            error = None
-        except AssertionError as e:
-            success = False
-            error = str(e)
-        except Exception as e:
-            success = False
-            error = f"{type(e).__name__}: {str(e)}"
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        
-        result = {
-            'name': name,
-            'success': success,
-            'error': error,
-            'duration': duration
-        }
+    def test(self, name, func, repeat=1, warmup=0, max_ms=None, max_alloc_kb=None):
+        """
+        Run and record a test.
+        Optionally fail it if the median run exceeds max_ms milliseconds
+        or the peak allocation exceeds max_alloc_kb kilobytes.
+        """
+        result = {'name': name}
+        result.update(measure(func, repeat, warmup, max_ms, max_alloc_kb))
         self.results.append(result)
         return result
-    
+
+    def run_parallel(self, tests, max_workers=None, use_processes=False):
+        """
+        Run independent tests concurrently and record them in submission order.
+
+        tests is a list of (name, func) or (name, func, options) tuples, where
+        options holds the keyword arguments accepted by test().
+        Latency-budgeted tests run serially after the others finish, since
+        concurrent work inflates their timings. Threads also share one
+        tracemalloc, so in thread mode allocation-budgeted tests run serially
+        too. With use_processes=True every pooled func must be picklable
+        (module-level); a test that cannot be run is recorded as failed.
+        """
+        specs = [(t[0], t[1], t[2] if len(t) > 2 else {}) for t in tests]
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        serial = [
+            i for i, (_, _, options) in enumerate(specs)
+            if options.get('max_ms') is not None
+            or (not use_processes and options.get('max_alloc_kb') is not None)
+        ]
+
+        measured = {}
+        with executor_class(max_workers=max_workers) as executor:
+            futures = {
+                i: executor.submit(measure, func, **options)
+                for i, (_, func, options) in enumerate(specs)
+                if i not in serial
+            }
+            for i, future in futures.items():
+                try:
+                    measured[i] = future.result()
+                except Exception as e:
+                    measured[i] = _unrunnable(e, specs[i][2])
+        for i in serial:
+            _, func, options = specs[i]
+            try:
+                measured[i] = measure(func, **options)
+            except Exception as e:
+                measured[i] = _unrunnable(e, options)
+
+        results = []
+        for i, (name, _, _) in enumerate(specs):
+            result = {'name': name}
+            result.update(measured[i])
+            results.append(result)
+        self.results.extend(results)
+        return results
+
     def assert_equal(self, actual, expected, message=None):
         """Assert equality with custom message"""
         if actual != expected:
@@ -74,6 +188,11 @@ class MinimalTester:
         for result in self.results:
             status = "✓" if result['success'] else "✗"
             print(f"\n{status} {result['name']} ({result['duration']:.3f}s)")
+            if result.get('median_ms') is not None and (
+                    result['runs'] > 1 or result.get('budget_ms') is not None):
+                print(f"  Median: {result['median_ms']:.3f}ms over {result['runs']} runs")
+            if result.get('peak_alloc_kb') is not None:
+                print(f"  Peak allocation: {result['peak_alloc_kb']:.1f}KB")
             if not result['success']:
                 print(f"  Error: {result['error']}")
         
@@ -81,6 +200,24 @@ class MinimalTester:
         passed = sum(1 for r in self.results if r['success'])
         print(f"\nTotal: {total}, Passed: {passed}, Failed: {total - passed}")
 
+    def report(self, path=None):
+        """
+        Build a machine-readable report of all results.
+        Writes it as JSON to path if given.
+        """
+        passed = sum(1 for r in self.results if r['success'])
+        report = {
+            'generated_at': datetime.now().isoformat(),
+            'total': len(self.results),
+            'passed': passed,
+            'failed': len(self.results) - passed,
+            'results': self.results,
+        }
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+        return report
+
 # Example usage
 if __name__ == "__main__":
     # Example without Flask
@@ -91,4 +228,8 @@ if __name__ == "__main__":
         tester.assert_in(3, [1, 2, 3], "List membership failed")
     
     tester.test("Basic Math", test_basic_math)
+
+    # Performance budgets: median under 5ms, peak allocation under 64KB
+    tester.test("Sum Budget", lambda: sum(range(10000)),
+                repeat=20, warmup=2, max_ms=5, max_alloc_kb=64)
     tester.print_results()
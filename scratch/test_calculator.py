@@ -104,9 +104,33 @@ class CalculatorTestSession(TestSession):
 
         self.tester.test("Calculator API Tests", test_endpoints)
 
+    def test_performance(self):
+        from app.calculator import calculate, evaluate_equation
+
+        def equation_speed():
+            evaluate_equation("10*4+3-2/5*7+1")
+
+        def operation_speed():
+            calculate({"operation": "add", "numbers": list(range(100))})
+
+        def equation_correctness():
+            for i in range(100):
+                self.tester.assert_equal(evaluate_equation(f"{i}*2+1"), i * 2 + 1)
+
+        self.tester.run_parallel([
+            ("Equation Correctness", equation_correctness),
+            ("Operation Correctness", lambda: self.tester.assert_equal(
+                calculate({"operation": "multiply", "numbers": [2, 3, 4]}), 24)),
+            ("Equation Latency", equation_speed, {'repeat': 100, 'warmup': 10, 'max_ms': 1}),
+            ("Operation Latency", operation_speed, {'repeat': 100, 'warmup': 10, 'max_ms': 1}),
+            ("Equation Allocation", equation_speed, {'max_alloc_kb': 16}),
+        ])
+
 if __name__ == "__main__":
     session = CalculatorTestSession()
     print("=== Running Calculator Tests ===")
     session.test_direct_functions()
     session.test_api_endpoints()
+    session.test_performance()
     session.tester.print_results()
+    session.tester.report("test_report.json")
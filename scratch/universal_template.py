@@ -85,6 +85,24 @@ class TestSession:
 
         self.tester.test("API Endpoints", test_endpoints)
 
+    def test_performance(self):
+        """
+        Check latency and allocation budgets.
+        Add your performance tests here. Unbudgeted checks run concurrently;
+        budgeted checks run one at a time after them.
+        """
+        def basic_math():
+            sum(range(1000))
+
+        def basic_math_correctness():
+            self.tester.assert_equal(sum(range(1000)), 499500, "Sum failed")
+
+        self.tester.run_parallel([
+            ("Basic Math Correctness", basic_math_correctness),
+            ("Basic Math Latency", basic_math, {'repeat': 50, 'warmup': 5, 'max_ms': 1}),
+            ("Basic Math Allocation", basic_math, {'max_alloc_kb': 16}),
+        ])
+
 
 def main():
     """
@@ -97,8 +115,10 @@ def main():
         print("=== Running Tests ===")
         session.test_direct_functions()
         session.test_api_endpoints()
+        session.test_performance()
 
         session.tester.print_results()
+        session.tester.report("test_report.json")
 
     except Exception as e:
         print(f"\nError setting up tests: {type(e).__name__} - {str(e)}")
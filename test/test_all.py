@@ -103,6 +103,28 @@ def test_calculator_endpoint():
                          content_type='application/json')
     assert response.status_code == 400, "Division by zero should return 400"
 
+def test_calculator_batch_endpoint():
+    """Integration tests for batch calculator endpoint"""
+    client = app.calculator_server.app.test_client()
+    
+    data = [
+        {"equation": "2+3*4"},
+        {"operation": "add", "numbers": [5, 3, 2]},
+        {"operation": "divide", "numbers": [10, 0]},
+        {},
+    ]
+    response = client.post('/calculate/batch', json=data)
+    assert response.status_code == 200, "Batch endpoint status code failed"
+    results = json.loads(response.data.decode('utf-8'))["results"]
+    assert results[0] == {"result": 14}, "Batch equation failed"
+    assert results[1] == {"result": 10}, "Batch operation failed"
+    assert results[2] == {"error": "Division by zero"}, "Batch error not reported per item"
+    assert "error" in results[3], "Empty batch item should report an error"
+    
+    # Test non-list body
+    response = client.post('/calculate/batch', json={"equation": "2+2"})
+    assert response.status_code == 400, "Non-list batch should return 400"
+
 if __name__ == '__main__':
     # Create and run test suite
     runner = TestRunner()
@@ -112,6 +134,7 @@ if __name__ == '__main__':
     
     print("\n=== Running Calculator Endpoint Tests ===")
     runner.run_test(test_calculator_endpoint)
+    runner.run_test(test_calculator_batch_endpoint)
     
     # Print summary
     print(f"\n=== Test Summary ===")
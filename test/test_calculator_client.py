@@ -0,0 +1,181 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from werkzeug.serving import make_server
+
+from app.calculator_client import CalculatorClient, AsyncCalculatorClient
+from app.calculator_server import app
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive HTTP/1.1 server that replays queued responses"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.client_ports.append(self.client_address[1])
+        if self.server.responses:
+            status, content_type, body = self.server.responses.pop(0)
+        else:
+            status, content_type, body = 200, "application/json", json.dumps({"result": 4})
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    """Run a keep-alive stub server on a free port"""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.daemon_threads = True
+    httpd.responses = []
+    httpd.client_ports = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run the calculator server on a free port in a background thread"""
+    httpd = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_port
+    httpd.shutdown()
+
+
+def test_sync_client(server):
+    """Calls, errors, batches and latency tracking"""
+    with CalculatorClient("127.0.0.1", server) as client:
+        assert client.evaluate("10*4+3-2") == 41
+        assert client.calculate("multiply", [4, 3, 2]) == 24
+
+        with pytest.raises(ValueError, match="Division by zero"):
+            client.evaluate("10/0+5")
+
+        results = client.calculate_many([{"equation": "2+2"}, {"operation": "add"}])
+        assert results[0] == {"result": 4}
+        assert "error" in results[1]
+
+        assert client.latency_stats()["count"] == 4
+
+
+def test_sync_client_batches_concurrent_calls(server):
+    """Calls from several threads within the window share requests"""
+    with CalculatorClient("127.0.0.1", server, batch_window=0.2) as client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(client.evaluate, [f"{i}+1" for i in range(8)]))
+        assert results == [i + 1 for i in range(8)]
+        assert client.latency_stats()["count"] == 8, "Each call should be timed"
+        assert client.requests_sent < 8, "Calls were not batched"
+
+
+def test_sync_client_retries_then_raises():
+    """Connection failures are retried, then surfaced"""
+    client = CalculatorClient("127.0.0.1", 1, retries=1, backoff=0)
+    with pytest.raises(OSError):
+        client.evaluate("2+2")
+
+
+def test_sync_client_reuses_keep_alive_connections(stub):
+    """A keep-alive server sees every call on one pooled connection"""
+    with CalculatorClient("127.0.0.1", stub.server_port, pool_size=1) as client:
+        for _ in range(3):
+            assert client.evaluate("2+2") == 4
+    assert len(stub.client_ports) == 3
+    assert len(set(stub.client_ports)) == 1, "Connection was not reused"
+
+
+def test_sync_client_retries_unavailable(stub):
+    """A non-JSON 503 is retried; a non-JSON final answer names its status"""
+    stub.responses = [(503, "text/html", "<html>Service Unavailable</html>")]
+    with CalculatorClient("127.0.0.1", stub.server_port, backoff=0) as client:
+        assert client.evaluate("2+2") == 4
+        assert client.requests_sent == 2
+
+        stub.responses = [(503, "text/html", "<html>down</html>")] * 3
+        with pytest.raises(RuntimeError, match="status 503"):
+            client.evaluate("2+2")
+
+
+def test_closed_client_raises(stub):
+    """Calls after close fail fast instead of waiting on the pool"""
+    client = CalculatorClient("127.0.0.1", stub.server_port)
+    client.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        client.evaluate("2+2")
+
+
+def test_async_client_full_batch_flushes_early(stub):
+    """A full batch is sent at once and the window timer cancelled"""
+    stub.responses = [(200, "application/json", json.dumps({"results": [{"result": 4}] * 2}))]
+
+    async def run():
+        async with AsyncCalculatorClient("127.0.0.1", stub.server_port,
+                                         batch_window=10, max_batch=2) as client:
+            results = await asyncio.wait_for(
+                asyncio.gather(client.evaluate("2+2"), client.evaluate("2+2")), 5)
+            assert results == [4, 4]
+            assert client.requests_sent == 1
+
+    asyncio.run(run())
+
+
+def test_batched_failures_raise_separate_exceptions():
+    """Each batched caller gets its own exception, chained to the original"""
+    def run_sync():
+        client = CalculatorClient("127.0.0.1", 1, retries=0, batch_window=0.2)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(client.evaluate, "2+2") for _ in range(3)]
+        return [f.exception() for f in futures]
+
+    async def run_async():
+        client = AsyncCalculatorClient("127.0.0.1", 1, retries=0, batch_window=0.05)
+        return await asyncio.gather(*[client.evaluate("2+2") for _ in range(3)],
+                                    return_exceptions=True)
+
+    for errors in (run_sync(), asyncio.run(run_async())):
+        assert all(isinstance(e, OSError) for e in errors)
+        assert len({id(e) for e in errors}) == 3, "Callers share one exception"
+        originals = [e for e in errors if e.__cause__ is None]
+        assert len(originals) == 1
+        assert all(e.__cause__ is originals[0] for e in errors if e is not originals[0])
+
+
+def test_async_client(server):
+    """Async calls, including batched ones, resolve in order"""
+    async def run():
+        async with AsyncCalculatorClient("127.0.0.1", server) as client:
+            assert await client.evaluate("2+3*4") == 14
+
+        async with AsyncCalculatorClient("127.0.0.1", server, batch_window=0.05) as client:
+            results = await asyncio.gather(
+                client.evaluate("1+1"),
+                client.calculate("subtract", [10, 3]),
+                client.evaluate("4/0"),
+                return_exceptions=True,
+            )
+            assert results[:2] == [2, 7]
+            assert isinstance(results[2], ValueError)
+            assert client.latency_stats()["count"] == 3, "Each call should be timed"
+            assert client.requests_sent == 1, "Calls were not batched"
+
+    asyncio.run(run())
@@ -0,0 +1,88 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scratch'))
+
+import json
+import threading
+from minimal_tester import MinimalTester
+
+
+def _noop():
+    pass
+
+
+def test_timing_and_budgets():
+    """Latency and allocation budgets pass or fail the test"""
+    tester = MinimalTester()
+
+    result = tester.test("fast", lambda: None, repeat=5, warmup=2, max_ms=100)
+    assert result["success"], result["error"]
+    assert result["runs"] == 5, "Repeat count not honoured"
+    assert result["min_ms"] <= result["median_ms"] <= result["max_ms"], "Timing stats inconsistent"
+    assert result["budget_ms"] == 100 and result["max_ms"] < 100
+
+    result = tester.test("slow", lambda: sum(range(200000)), max_ms=0.000001)
+    assert not result["success"], "Latency budget should have failed"
+    assert "Latency budget exceeded" in result["error"]
+
+    result = tester.test("allocating", lambda: [0] * 100000, max_alloc_kb=1)
+    assert not result["success"], "Allocation budget should have failed"
+    assert result["peak_alloc_kb"] > 1, "Allocation not measured"
+    assert result["budget_alloc_kb"] == 1
+
+    result = tester.test("failing", lambda: tester.assert_equal(1, 2), repeat=3)
+    assert not result["success"] and result["error"] == "Expected 2, got 1"
+
+
+def test_run_parallel_and_report(tmp_path):
+    """Parallel runs keep submission order and appear in the report"""
+    tester = MinimalTester()
+
+    def boom():
+        raise ValueError("bad")
+
+    results = tester.run_parallel([
+        ("first", lambda: None),
+        ("second", boom),
+        ("third", lambda: [0] * 10, {"max_alloc_kb": 1024}),
+    ], max_workers=2)
+    assert [r["name"] for r in results] == ["first", "second", "third"]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["error"] == "ValueError: bad"
+
+    path = tmp_path / "report.json"
+    report = tester.report(str(path))
+    assert report["total"] == 3 and report["passed"] == 2 and report["failed"] == 1
+    assert json.loads(path.read_text())["results"][2]["name"] == "third"
+
+
+def test_budgeted_tests_run_serially_and_failures_print():
+    """Budgeted tests leave the pool, and broken perf tests still print"""
+    tester = MinimalTester()
+    threads = []
+
+    def boom():
+        raise ValueError("bad")
+
+    results = tester.run_parallel([
+        ("timed", lambda: threads.append(threading.current_thread()), {"max_ms": 1000}),
+        ("broken", boom, {"max_ms": 5, "warmup": 1}),
+    ])
+    assert threads == [threading.main_thread()], "Latency-budget test ran in the pool"
+    assert results[1]["runs"] == 0 and results[1]["median_ms"] is None
+    tester.print_results()
+
+
+def test_process_mode_records_unrunnable_tests():
+    """An unpicklable func fails its own test without losing the others"""
+    tester = MinimalTester()
+    results = tester.run_parallel([
+        ("picklable", _noop, {"repeat": 3}),
+        ("lambda", lambda: None),
+        ("bad option", _noop, {"max_ms": 1000, "bogus": True}),
+    ], use_processes=True)
+    assert [r["success"] for r in results] == [True, False, False]
+    assert results[0]["runs"] == 3
+    assert results[1]["runs"] == 0 and "pickle" in results[1]["error"]
+    assert results[2]["error"].startswith("TypeError") and results[2]["budget_ms"] == 1000